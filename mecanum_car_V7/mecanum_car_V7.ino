@@ -23,6 +23,7 @@
 //    • Serial command  "TEST\n"  triggers motor self-test on demand
 //    • Serial command  "PING\n"  replies  "PONG"  for comms check
 //    • Low-latency 5 ms loop (200 Hz) — reduced from 20 ms
+//    • Status block throttled to 10 Hz (was every packet)
 // ================================================================
 
 
@@ -122,6 +123,8 @@
 #define LOOP_MS          5    // 200 Hz loop — reduced from 20 ms
                               //   gives ~5 ms input-to-motor latency
 #define SERIAL_TIMEOUT 500    // ms — stop motors if comms lost
+#define STATUS_MS      100    // ms between status blocks (10 Hz)
+                              //   each block still stalls TX ~40 ms
 
 #define SELFTEST_SPEED  80    // PWM value used during on-demand self-test
 #define SELFTEST_MS    400    // ms each motor runs during self-test
@@ -135,6 +138,7 @@ int currentLF = 0,  currentLB = 0,  currentRF = 0,  currentRB = 0;
 
 unsigned long lastPacketTime = 0;
 unsigned long lastLEDTime    = 0;
+unsigned long lastStatusTime = 0;
 bool          ledState       = false;
 bool          motorsEnabled  = true;   // set false while TEST command runs
 
@@ -264,7 +268,8 @@ void printBar(int speed, int maxSpeed, int width) {
 // ================================================================
 //  processGamepad()
 //  Takes joystick values, sets targetXX for all 4 motors,
-//  and prints a detailed status block to Serial.
+//  and prints a detailed status block to Serial (at most once
+//  every STATUS_MS — targets are still updated on every packet).
 //
 //  MECANUM FORMULA (top view):
 //
@@ -346,6 +351,10 @@ void processGamepad(int joyX, int joyY, int rJoyX) {
     targetRF = rf;
     targetRB = rb;
 
+    unsigned long now = millis();
+    if (now - lastStatusTime < STATUS_MS) return;
+    lastStatusTime = now;
+
     // ----------------------------------------------------------
     //  ===  SERIAL OUTPUT  ===
     //
@@ -568,6 +577,7 @@ void setup() {
     Serial.print  (F("  RAMP UP     = ")); Serial.println(RAMP_UP_STEP);
     Serial.print  (F("  RAMP DOWN   = ")); Serial.println(RAMP_DOWN_STEP);
     Serial.print  (F("  TIMEOUT     = ")); Serial.print(SERIAL_TIMEOUT); Serial.println(F(" ms"));
+    Serial.print  (F("  STATUS      = every ")); Serial.print(STATUS_MS); Serial.println(F(" ms"));
     Serial.println(F("  RB_DIR      = pin 36  (Timer-safe, reliable)"));
     Serial.println(F("  RB_PWM      = pin 6   (Timer4A, no conflict)"));
     Serial.print  (F("  INVERT FLAGS: LF=")); Serial.print(LF_INVERT);
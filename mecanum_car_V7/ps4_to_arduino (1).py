@@ -23,7 +23,7 @@ import sys
 
 # ─── CONFIG ────────────────────────────────────────────────
 BAUD_RATE     = 115200
-SEND_INTERVAL = 0.02      # 50 Hz — matches Arduino 20 ms loop
+SEND_RATE     = 50        # Hz — packets per second (one every 20 ms)
 
 # Pygame axis indices for PS4 controller
 AXIS_LX = 0   # Left  stick horizontal
@@ -90,7 +90,8 @@ def main():
     print()
 
     # ── Main loop ────────────────────────────────────────────
-    last_send = 0
+    clock      = pygame.time.Clock()
+    last_shown = None   # last (lx, ly, rx) printed to the live display
 
     try:
         while True:
@@ -107,24 +108,24 @@ def main():
             ly = scale_axis(-ly_raw)
             rx = scale_axis( rx_raw)
 
-            # Send at 50 Hz
-            now = time.time()
-            if now - last_send >= SEND_INTERVAL:
-                last_send = now
-                packet = build_packet(lx, ly, rx)
-                try:
-                    ser.write(packet)
-                except serial.SerialException as e:
-                    print(f"\n[ERROR] Serial write failed: {e}")
-                    break
-
-                # Live display
+            # Send one packet per tick
+            packet = build_packet(lx, ly, rx)
+            try:
+                ser.write(packet)
+            except serial.SerialException as e:
+                print(f"\n[ERROR] Serial write failed: {e}")
+                break
+
+            # Live display — only repaint when the values change
+            if (lx, ly, rx) != last_shown:
+                last_shown = (lx, ly, rx)
                 print(
                     f"\r  LX:{lx:+4d}  LY:{ly:+4d}  RX:{rx:+4d}   ",
                     end="", flush=True
                 )
 
-            time.sleep(0.001)
+            # Sleep until the next SEND_RATE slot instead of polling every 1 ms
+            clock.tick(SEND_RATE)
 
     except KeyboardInterrupt:
         print("\n\n[INFO] Quit by user.")